@@ -22,6 +22,7 @@ from .section_field import (
     export_polygon_vertices_csv,
     export_polygon_vertices_csv_file,
     compute_lobatto_integration_points,
+    clear_section_cache,
 )
 
 from .continuous_section_field import (
@@ -165,6 +165,22 @@ def register(
         # Expand z values
         z_list = expand_station_names(stations_map, action["stations"])
 
+        outputs = action["output"]
+
+        # Support both: output: [stdout] and output: [[...]] (defensive flatten).
+        # The common case is already flat: skip the rebuild entirely.
+        flat_outputs: List[Any]
+        if not any(isinstance(o, list) for o in outputs):
+            flat_outputs = list(outputs)
+        else:
+            flat_outputs = [x for o in outputs for x in (o if isinstance(o, list) else [o])]
+
+        # The text report is only needed for stdout or non-CSV files; a CSV-only
+        # run builds the numeric rows and skips report formatting entirely.
+        want_stdout = ("stdout" in flat_outputs)
+        want_text_file = any((isinstance(o, str) and o != "stdout" and Path(o).suffix.lower() != ".csv") for o in flat_outputs)
+        want_report = want_stdout or want_text_file
+
         rows: List[Dict[str, Any]] = []
 
         report_blocks: List[str] = []
@@ -178,27 +194,38 @@ def register(
                 except Exception:
                     return str(v)
             return str(v)
-        
+
+        # Station-invariant report pieces: resolved once, reused for every z.
+        prop_meanings = [_ALLOWED_KEYS_MEANING.get(k, "Unknown key (not documented)") for k in props]
+        line_fmt = "{:20s}: {}  [{}]".format
+        # One capture buffer for all stations (rewound before each report).
+        buf = io.StringIO()
+        # Sections kept for the CSV geometry block (no second field.section(z)).
+        sections: List[Any] = []
+
         for z in z_list:
             
             sec = field.section(float(z))
+            if geometry_out:
+                sections.append(sec)
             # Compute the full analysis dictionary (single source of truth),
             # then filter (and optionally override J_sv based on torsion_alpha_sv).
             full = section_full_analysis(sec)
 
             # If the user requests 'J_sv', enforce the explicit alpha policy.
-            buf = io.StringIO()
-            with redirect_stdout(buf):
-                if props:
-                    print(f"### SECTION SELECTED ANALYSIS @ z = {float(z)} ###")
-                for k in props:
-                    meaning = _ALLOWED_KEYS_MEANING.get(k, "Unknown key (not documented)")
-                    print(f"{k:20s}: {_format_value(full.get(k))}  [{meaning}]")
-                if geometry_out:                     
-                    export_polygon_vertices_csv(section=sec, field=field, zpos=None,fmt=fmt)
-                    
-            report_text = buf.getvalue()
-            report_blocks.append(report_text)
+            if want_report:
+                buf.seek(0)
+                buf.truncate()
+                with redirect_stdout(buf):
+                    if props:
+                        print(f"### SECTION SELECTED ANALYSIS @ z = {float(z)} ###")
+                    for k, meaning in zip(props, prop_meanings):
+                        print(line_fmt(k, _format_value(full.get(k)), meaning))
+                    if geometry_out:                     
+                        export_polygon_vertices_csv(section=sec, field=field, zpos=None,fmt=fmt)
+                        
+                report_text = buf.getvalue()
+                report_blocks.append(report_text)
             
             if props:
                 row = {"z": float(z)}
@@ -209,16 +236,6 @@ def register(
         # ---------------------------------------------------------------------
         # Output routing
         # ---------------------------------------------------------------------
-        outputs = action["output"]
-
-        # Support both: output: [stdout] and output: [[...]] (defensive flatten)
-        flat_outputs: List[Any] = []
-        for outp in outputs:
-            if isinstance(outp, list):
-                flat_outputs.extend(outp)   
-            else:
-                flat_outputs.append(outp)
-
         for outp in flat_outputs:            
             if outp == "stdout":
                 for blk in report_blocks:
@@ -246,8 +263,7 @@ def register(
                         # --- Append polygon-vertices CSV after the main table -------------------
                         f.write("\n")  # separator line between the two CSV blocks
                     if geometry_out: 
-                        for z in z_list:
-                            sec = field.section(float(z))
+                        for sec in sections:
                             export_polygon_vertices_csv(
                                 section=sec,          # or section=None if you want to use field+zpos
                                 field=field,          # or field=field
@@ -19,12 +19,18 @@ Important
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 # -----------------------------------------------------------------------------
 # Action SPEC (help/validation)
 # -----------------------------------------------------------------------------
+
+# Built SPEC objects, keyed by the identity of the injected ActionSpec/ParamSpec
+# classes, so re-registration in the same process reuses the same SPEC.
+_SPEC_CACHE: Dict[Tuple[int, int], Any] = {}
+
+
 def _build_spec(ActionSpec: Any, ParamSpec: Any) -> Any:
     """Build ActionSpec for write_opensees_geometry.
 
@@ -82,6 +88,19 @@ def _build_spec(ActionSpec: Any, ParamSpec: Any) -> Any:
 # -----------------------------------------------------------------------------
 # Runner (copied from the monolithic implementation; minimal adaptations)
 # -----------------------------------------------------------------------------
+def _single_output_path(output_list: List[Any]) -> str:
+    """Return the only file path in output_list (strings other than 'stdout').
+
+    Stops at the second file path instead of materializing the filtered list.
+    """
+    files = (o for o in output_list if isinstance(o, str) and o != "stdout")
+    first = next(files, None)
+    if first is None or next(files, None) is not None:
+        # Defensive check (should not happen if validation passed).
+        raise ValueError(f"write_opensees_geometry requires exactly one output Tcl path, got: {output_list}")
+    return first
+
+
 def _run(
     field: Any,
     stations_map: Dict[str, List[float]],
@@ -123,11 +142,7 @@ def _run(
     nu = params.get("nu")
 
     output_list = action.get("output", [])
-    out_files = [o for o in output_list if isinstance(o, str) and o != "stdout"]
-    if len(out_files) != 1:
-        # Defensive check (should not happen if validation passed).
-        raise ValueError(f"write_opensees_geometry requires exactly one output Tcl path, got: {output_list}")
-    tcl_path = out_files[0]
+    tcl_path = _single_output_path(output_list)
 
     # Delegate export to the helper function.
     # The writer is responsible for generating the correct Tcl content.
@@ -155,7 +170,10 @@ def register(
 
     All dependencies are injected explicitly from CSFActions.py to avoid import cycles.
     """
-    SPEC = _build_spec(ActionSpec, ParamSpec)
+    key = (id(ActionSpec), id(ParamSpec))
+    SPEC = _SPEC_CACHE.get(key)
+    if SPEC is None:
+        SPEC = _SPEC_CACHE.setdefault(key, _build_spec(ActionSpec, ParamSpec))
 
     def RUN(field: Any, stations_map: Dict[str, List[float]], action: Dict[str, Any], *, debug_flag: bool = False) -> None:
         _run(field, stations_map, action, debug_flag=debug_flag, write_opensees_geometry=write_opensees_geometry)
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional, List, Tuple, Union, Literal
-import math, random, warnings, os, sys, re, io
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Union, Literal
+import math, random, warnings, os, sys, re, io, ast
+from types import CodeType
 import numpy as np
 import matplotlib.pyplot as plt
 from collections import defaultdict
@@ -8,7 +9,7 @@ from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
 import random as _random
-from .entities import Pt, Polygon, Section, CSFError
+from .entities import Pt, Polygon, Section, CSFError, _VECTORIZE_MIN_VERTICES
 from csf.section_field import section_properties
 from . import _tol
 
@@ -19,6 +20,7 @@ from .section_field import (
     _bbox_xy, _point_in_poly_inclusive, _point_on_segment_sq,
     polygon_has_self_intersections, polygon_inertia_about_origin,
     section_print_analysis, _signed_area_centroid_xy, _simple_yaml_dump, _csf__section_to_Sz_dict, 
+    _polygon_signed_area, _compile_weight_formula,
 )
 
 from .section_field import compute_lobatto_integration_points,section_full_analysis, evaluate_weight_formula, evaluate_weight_formula_zrelative, evaluate_shear_weight_formula
@@ -125,7 +127,7 @@ class ContinuousSectionField:
                 if (idx + 1) in self.weight_laws:
                     weight_law = str(self.weight_laws[idx + 1])
 
-            area_signed, _ = _polygon_signed_area_and_centroid(poly)
+            area_signed = _polygon_signed_area(poly)
 
             if idx in children_map:
                 direct_children_idx = list(children_map[idx])
@@ -1004,7 +1006,7 @@ class ContinuousSectionField:
             if not hasattr(poly, "weightabs"):
                 raise ValueError(f"Polygon idx={idx} at z={z} has no 'weightabs' attribute.")
 
-            signed_area, (_, _) = _polygon_signed_area_and_centroid(poly)
+            signed_area = _polygon_signed_area(poly)
 
             area_geom[idx] = float(signed_area)
             w_rel_map[idx] = float(poly.weight)
@@ -1302,9 +1304,15 @@ class ContinuousSectionField:
         # single source of truth
         self.z0 = section0.z
         self.z1 = section1.z
+        # segment length, read by the per-z interpolation paths
+        self._L = abs(self.z1 - self.z0)
         self._determine_magnitude()
         # Optional list of callables or strings for custom weight interpolation
         self.weight_laws: Optional[Dict[int, str]] = None
+        # Code objects of the weight laws, keyed by formula string (see set_weight_laws)
+        self._compiled_laws: Dict[str, CodeType] = {}
+        # Weight laws that are numeric literals ("3.5", "-2e5"), keyed by formula string
+        self._const_laws: Dict[str, float] = {}
         self.shear_weight_laws_default: Optional[str] = None   
         self.shear_weight_laws: Optional[Dict[int, str]] = None
         self._validate_inputs()
@@ -1336,6 +1344,16 @@ class ContinuousSectionField:
         s = str(name or "").strip()
         return re.sub(r'(?i)@(cell|wall|closed)\b.*$', '', s).strip()
 
+    def _name_index_map(self, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Map each stripped polygon name to its 0-based position.
+        Keeps the first occurrence of a repeated name, as list.index() does.
+        """
+        name_to_idx: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            name_to_idx.setdefault(name, i)
+        return name_to_idx
+
 
     def set_shear_weight_laws(self, laws: Union[List[str], Dict[Union[int, str], str]]) -> None:
         """
@@ -1355,6 +1373,8 @@ class ContinuousSectionField:
 
         valid_names0 = [self._strip_model_tags(p.name) for p in self.s0.polygons]
         valid_names1 = [self._strip_model_tags(p.name) for p in self.s1.polygons]
+        name_to_idx0 = self._name_index_map(valid_names0)
+        name_to_idx1 = self._name_index_map(valid_names1)
 
         # Reset current shear-weight laws.
         self.shear_weight_laws_default = None
@@ -1406,18 +1426,18 @@ class ContinuousSectionField:
                 if len(raw_names) == 2:
                     n0, n1 = raw_names
 
-                    if n0 not in valid_names0:
+                    if n0 not in name_to_idx0:
                         raise KeyError(
                             f"Critical Error: Polygon '{n0}' not found in Section 0."
                         )
 
-                    if n1 not in valid_names1:
+                    if n1 not in name_to_idx1:
                         raise KeyError(
                             f"Critical Error: Polygon '{n1}' not found in Section 1."
                         )
 
-                    idx0 = valid_names0.index(n0)
-                    idx1 = valid_names1.index(n1)
+                    idx0 = name_to_idx0[n0]
+                    idx1 = name_to_idx1[n1]
 
                     if idx0 != idx1:
                         raise ValueError(
@@ -1430,12 +1450,12 @@ class ContinuousSectionField:
                 elif len(raw_names) == 1:
                     n0 = raw_names[0]
 
-                    if n0 not in valid_names0:
+                    if n0 not in name_to_idx0:
                         raise KeyError(
                             f"Critical Error: Polygon '{n0}' not found."
                         )
 
-                    idx0 = valid_names0.index(n0)
+                    idx0 = name_to_idx0[n0]
                     normalized_map[idx0] = formula
 
                 else:
@@ -1471,12 +1491,12 @@ class ContinuousSectionField:
                 elif isinstance(key, str):
                     n0 = self._strip_model_tags(key.strip())
 
-                    if n0 not in valid_names0:
+                    if n0 not in name_to_idx0:
                         raise KeyError(
                             f"Critical Error: Polygon '{n0}' not found."
                         )
 
-                    idx = valid_names0.index(n0)
+                    idx = name_to_idx0[n0]
                     normalized_map[idx] = formula
 
                 else:
@@ -1561,8 +1581,12 @@ class ContinuousSectionField:
         # Keep original polygon names as declared in S0/S1 strip @cell @wall
         valid_names0 = [self._strip_model_tags(p.name) for p in self.s0.polygons]
         valid_names1 = [self._strip_model_tags(p.name) for p in self.s1.polygons]
+        name_to_idx0 = self._name_index_map(valid_names0)
+        name_to_idx1 = self._name_index_map(valid_names1)
         # Reset current laws 
         self.weight_laws = {}
+        self._compiled_laws = {}
+        self._const_laws = {}
         normalized_map = {}
         
         # 1. PARSING & STRICT TRANSLATION
@@ -1576,13 +1600,13 @@ class ContinuousSectionField:
                     if len(raw_names) == 2:
                         n0, n1 = raw_names
                         # STRICT CHECK: If the name does not exist, Error
-                        if n0 not in valid_names0:
+                        if n0 not in name_to_idx0:
                             raise KeyError(f"Critical Error: Polygon '{ raw_names[0]}' not found in Section 0.")
-                        if n1 not in valid_names1:
+                        if n1 not in name_to_idx1:
                             raise KeyError(f"Critical Error: Polygon '{raw_names[1]}' not found in Section 1.")
                         
-                        idx0 = valid_names0.index(n0) + 1
-                        idx1 = valid_names1.index(n1) + 1
+                        idx0 = name_to_idx0[n0] + 1
+                        idx1 = name_to_idx1[n1] + 1
                         
                         
                         # STRICT CHECK: Homology (must be the same polygon)
@@ -1594,13 +1618,13 @@ class ContinuousSectionField:
                     
                     elif len(raw_names) == 1:
                         n0 = raw_names[0]
-                        if n0 not in valid_names0:
+                        if n0 not in name_to_idx0:
                             raise KeyError(f"Critical Error: Polygon '{n0}' not found.")
-                        normalized_map[valid_names0.index(n0) + 1] = formula # 1 based 
+                        normalized_map[name_to_idx0[n0] + 1] = formula # 1 based 
                 else:
-                   if n0 not in valid_names0:
+                   if n0 not in name_to_idx0:
                        raise ValueError(f"Critical Error: Polygon '{n0}' not found.")
-                   normalized_map[valid_names0.index(n0) + 1] = formula
+                   normalized_map[name_to_idx0[n0] + 1] = formula
                 
                    # Positional list case
                    # if i < num_polygons:
@@ -1623,12 +1647,9 @@ class ContinuousSectionField:
                         p0_test = self.s0.polygons[idx-1]
                         p1_test = self.s1.polygons[idx-1]
                         
-                        # Generation of midpoint vertices for p_mid (required for d(i,j) helper)
-                        current_verts = tuple(v0.lerp(v1,z_mid,L_val) for v0, v1 in zip(p0_test.vertices, p1_test.vertices))
-                        
-                        # 1. Calculate the total length of the field
-                        l_total = abs(self.s1.z - self.s0.z)
-                        
+                        # d(i,j) computes distances from the interpolated
+                        # referenced vertices (see _lazy_distance_at_z), so
+                        # there is no polygon to build here.
                         try:
                             # We test the formula at mid-span (t=0.5) to verify syntax and logic
                             
@@ -1655,6 +1676,16 @@ class ContinuousSectionField:
            
             # Save as an integer for the interpolator
             self.weight_laws[idx] = str(formula)
+            # Numeric literals are returned as-is by _interpolate_weight (no eval);
+            # other laws are compiled once here and the code object goes to eval()
+            try:
+                const = ast.literal_eval(self.weight_laws[idx])
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                const = None
+            if isinstance(const, (int, float)):
+                self._const_laws[self.weight_laws[idx]] = float(const)
+            else:
+                self._compiled_laws[self.weight_laws[idx]] = _compile_weight_formula(self.weight_laws[idx])
             #print(f"DEBUG idx {idx}")
             '''
             try:
@@ -1684,23 +1715,20 @@ class ContinuousSectionField:
             
     def _interpolate_weight(self, w0: float, w1: float, z: float, p0: Polygon, p1: Polygon, law: Optional[str]) -> float:
         
-        L_val = abs(self.s1.z - self.s0.z)
-        
         if isinstance(law, str) and law.strip():
+            # Constant law: same value eval() would give, without the sandbox
+            if law in self._const_laws:
+                return self._const_laws[law]
+
             # z is real RELATIVE not [0..1]
             # Use the existing section attributes. 
             # Based on the error, self.section1 doesn't exist. 
             # In ContinuousSectionField, endpoints are usually self.s0 and self.s1
-            # Since p_current is not in the signature, we interpolate vertices 
-            # locally to allow the d(i, j) helper to work at height z
-            #
-            
-            
-            #current_verts = tuple(v0.lerp(v1, z,L_val) for v0, v1 in zip(p0.vertices, p1.vertices))
-            #p_current = Polygon(vertices=current_verts, weight=w0, name=p0.name) ## w0 is dummy value
-            
+            # No polygon at z is built here: evaluate_weight_formula gets the
+            # endpoints and d(i, j) interpolates only the vertices it reads.
             try:
-                wcust = evaluate_weight_formula(law, p0, p1, self.s0.z,self.s1.z,zt=z)  
+                code = self._compiled_laws.get(law, law)
+                wcust = evaluate_weight_formula(code, p0, p1, self.s0.z,self.s1.z,zt=z)  
                 return wcust
             except Exception as e:                  
                 raise ValueError(
@@ -1711,7 +1739,7 @@ class ContinuousSectionField:
             
         # Default fallback: Linear Interpolation
         #
-        return w0 + (w1 - w0)/L_val * z
+        return w0 + (w1 - w0)/self._L * z
 
 
 
@@ -1750,7 +1778,125 @@ class ContinuousSectionField:
 
 
 
+    def sections(self, z_values: Sequence[float]) -> List[Section]:
+        """
+        Sections at several stations; same result as [self.section(z) for z in z_values].
+
+        Vertex interpolation for all stations is done with one broadcast
+        expression per polygon pair (stations x vertices x 2), using the same
+        arithmetic as Pt.lerp, so the vertices are bit-identical to section(z).
+        """
+        z_list = list(z_values)
+        if not z_list:
+            return []
+
+        origz = np.asarray(z_list, dtype=np.float64) - self.z0
+
+        # per polygon: (n_z, n_verts, 2) nested lists, or None -> per-vertex lerp
+        batched: List[Optional[list]] = []
+        for pair in self._vertex_slopes():
+            if pair is None:
+                batched.append(None)
+                continue
+            xy0, slope = pair
+            batched.append((xy0[None, :, :] + slope[None, :, :] * origz[:, None, None]).tolist())
+
+        return [
+            self._section_at(
+                z,
+                [
+                    None if xy is None else tuple(Pt(x, y) for x, y in xy[k])
+                    for xy in batched
+                ],
+            )
+            for k, z in enumerate(z_list)
+        ]
+
     def section(self, z: float) -> Section: 
+        return self._section_at(z)
+
+    def _vertex_slopes(self) -> List[Optional[Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Per polygon pair, the (xy0, slope) arrays of the vertex interpolation
+        xy(z) = xy0 + slope * (z - z0), with the arithmetic of Pt.lerp; None
+        when the pair must go through Pt.lerp (vertex count mismatch or
+        zero length).
+
+        Built on first use and reused by section() and sections(); it is
+        rebuilt if s0/s1 are replaced.
+        """
+        return self._vertex_slopes_cached()[0]
+
+    def _vertex_slopes_cached(self) -> Tuple[list, Optional[Tuple[np.ndarray, np.ndarray, list]]]:
+        """
+        (slopes, stacked): slopes as returned by _vertex_slopes(); stacked is
+        (xy0, slope, bounds) with the arrays of all interpolable pairs
+        concatenated and bounds[i] = (start, stop) rows of pair i, or None
+        when no pair is interpolable.
+        """
+        cached = self.__dict__.get("_vertex_slopes_cache")
+        if cached is not None and cached[0] is self.s0 and cached[1] is self.s1:
+            return cached[2], cached[3]
+
+        # Read from the stations themselves, not self._L, so a replaced s0/s1
+        # also gets its own length.
+        lenght = abs(self.s1.z - self.s0.z)
+        slopes: List[Optional[Tuple[np.ndarray, np.ndarray]]] = []
+        for p0, p1 in zip(self.s0.polygons, self.s1.polygons):
+            if abs(lenght) < _tol.EPS_L or len(p0.vertices) != len(p1.vertices):
+                slopes.append(None)
+                continue
+            xy0 = p0.as_xy()
+            slopes.append((xy0, (p1.as_xy() - xy0) / lenght))
+
+        stacked = None
+        pairs = [pair for pair in slopes if pair is not None]
+        if pairs:
+            bounds: List[Optional[Tuple[int, int]]] = []
+            start = 0
+            for pair in slopes:
+                if pair is None:
+                    bounds.append(None)
+                    continue
+                bounds.append((start, start + pair[0].shape[0]))
+                start += pair[0].shape[0]
+            stacked = (
+                np.concatenate([xy0 for xy0, _ in pairs]),
+                np.concatenate([slope for _, slope in pairs]),
+                bounds,
+            )
+
+        self._vertex_slopes_cache = (self.s0, self.s1, slopes, stacked)
+        return slopes, stacked
+
+    def _interpolated_vertices(self, origz: float) -> List[Optional[Tuple[Pt, ...]]]:
+        """
+        Vertices of every polygon pair at relative z, or None where the pair
+        goes through Pt.lerp (see _vertex_slopes).
+
+        All pairs are interpolated with a single array expression on the
+        stacked slopes, bit-identical to Pt.lerp. Below
+        _VECTORIZE_MIN_VERTICES vertices in total the array overhead is not
+        worth it and every entry is None.
+        """
+        slopes, stacked = self._vertex_slopes_cached()
+        if stacked is None or stacked[0].shape[0] < _VECTORIZE_MIN_VERTICES:
+            return [None] * len(slopes)
+
+        xy0, slope, bounds = stacked
+        xy = (xy0 + slope * origz).tolist()
+        pts = [Pt(x, y) for x, y in xy]
+        return [None if b is None else tuple(pts[b[0]:b[1]]) for b in bounds]
+
+    def _section_at(
+        self,
+        z: float,
+        vertices_by_polygon: Optional[Sequence[Optional[Tuple[Pt, ...]]]] = None,
+    ) -> Section:
+        """
+        Build the section at z. vertices_by_polygon optionally supplies the
+        already-interpolated vertices of each polygon pair (see sections()).
+        """
         #-----------------------------------------------------
         # helpers
         #-----------------------------------------------------
@@ -2037,14 +2183,19 @@ class ContinuousSectionField:
         origz=z-self.z0 # make origz relative
         
         #t = self._to_t(z) # normalize z 
-        lenght = abs(self.z1 - self.z0)
+        lenght = self._L
         if z < self.z0 or z > self.z1:
             raise CSFError(f"z={z} out of bounds [{self.z0}, {self.z1}]")
         polys: List[Polygon] = []
 
+        if vertices_by_polygon is None:
+            vertices_by_polygon = self._interpolated_vertices(origz)
+
         for i, (p0, p1) in enumerate(zip(self.s0.polygons, self.s1.polygons)):
                         
-            verts = tuple(v0.lerp(v1, origz,lenght) for v0, v1 in zip(p0.vertices, p1.vertices))
+            verts = vertices_by_polygon[i]
+            if verts is None:
+                verts = tuple(v0.lerp(v1, origz,lenght) for v0, v1 in zip(p0.vertices, p1.vertices))
             #print(f"DEBUG t {p0.name} {p1.name}")
             # keep weight/name from p0 by default
             # polys.append(Polygon(vertices=verts, weight=p0.weight, name=p0.name))
@@ -2204,6 +2355,9 @@ class ContinuousSectionField:
                             name=poly_name
                         )
 
+            # Disabled: section(z) runs no per-z self-intersection test, so there
+            # is nothing to skip for convex endpoint pairs. A collapsed
+            # interpolation is still rejected by the Polygon area check above.
             '''
             if not re.search(r'(?i)@(cell|wall|closed)\b', str(poly.name or "")) and  polygon_has_self_intersections(poly):
                 #silent
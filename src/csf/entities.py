@@ -1,10 +1,17 @@
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from collections.abc import Mapping
+import numpy as np
 from . import _tol
 class CSFError(ValueError):
     pass
 
+# Below this vertex count scalar per-vertex loops beat NumPy call overhead
+# (Polygon validation here, the section integrators in section_field).
+# The dense paths are whole-array NumPy rather than JIT kernels: Numba is not
+# a project dependency, and the per-vertex work is a handful of flops.
+_VECTORIZE_MIN_VERTICES = 64
+
 # -------------------------
 # Geometry primitives
 # -------------------------
@@ -64,12 +71,19 @@ class Polygon:
         # We use the Shoelace formula to calculate the signed area (a2).
         # A positive result indicates CCW, a negative result indicates CW.
         verts = self.vertices
-        n = len(verts)
-        a2 = 0.0
-        for i in range(n):
-            x0, y0 = verts[i].x, verts[i].y
-            x1, y1 = verts[(i + 1) % n].x, verts[(i + 1) % n].y
-            a2 += (x0 * y1 - x1 * y0)
+        if len(verts) >= _VECTORIZE_MIN_VERTICES:
+            # Dense polygon: one pass over the SoA coordinates, which stay
+            # cached for the integrators downstream.
+            xy = self.as_xy()
+            xs = xy[:, 0]
+            ys = xy[:, 1]
+            a2 = float((xs * np.roll(ys, -1) - np.roll(xs, -1) * ys).sum())
+        else:
+            xs = [v.x for v in verts]
+            ys = [v.y for v in verts]
+            a2 = 0.0
+            for x0, y0, x1, y1 in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]):
+                a2 += (x0 * y1 - x1 * y0)
         
         # If a2 is negative, the winding order is Clockwise (CW).
         if a2 <= 0:
@@ -84,24 +98,33 @@ class Polygon:
                     f"GEOMETRIC ERROR: Polygon '{self.name}' has zero area (degenerate polygon). "
                     f"A polygon must have at least 3 non-collinear vertices (it cannot have only 2 sides)."
                 )        
-        # GEOMETRIC INTEGRITY CHECK
-        if a2 < _tol.EPS_A:  # Covers both negative area and zero area
-            if a2 < 0:
-                # Case: Clockwise (CW) order
-                raise ValueError(
-                    f"GEOMETRIC ERROR: Polygon '{self.name}' is defined in Clockwise (CW) order. "
-                    f"All polygons must be Counter-Clockwise (CCW). "
-                    f"Use weight={self.weight} for voids instead of flipping vertices."
-                )
-            else:
-                # Case: Zero Area (2 sides or collinear points)
-                raise ValueError(
-                    f"GEOMETRIC ERROR: Polygon '{self.name}' has zero area (degenerate). "
-                    f"A polygon must have at least 3 non-collinear vertices to enclose an area."
-                )
+        # Keep the (unweighted) signed area: area-only consumers reuse it
+        # instead of walking the vertices again.
+        object.__setattr__(self, "_signed_area", 0.5 * a2)
+
         # Default shear weight follows the standard weight unless explicitly set.
         if self.shear_weight is None:
             object.__setattr__(self, "shear_weight", self.weight)
+
+    def as_xy(self) -> np.ndarray:
+        """
+        Vertex coordinates as a read-only (n, 2) float64 array.
+
+        The storage is struct-of-arrays: xy[:, 0] (all x) and xy[:, 1]
+        (all y) are each contiguous, which is what vectorized loops want.
+        Built on first use and cached on the instance; vertices are an
+        immutable tuple on a frozen dataclass, so the cache never goes stale.
+        """
+        xy = self.__dict__.get("_xy")
+        if xy is None:
+            verts = self.vertices
+            xy = np.array(
+                ([v.x for v in verts], [v.y for v in verts]),
+                dtype=np.float64,
+            ).T
+            xy.flags.writeable = False
+            object.__setattr__(self, "_xy", xy)
+        return xy
             
 
 
@@ -132,25 +155,26 @@ class Section:
                 "Section must contain at least one Polygon."
             )
 
-        for p in self.polygons:
-            if not isinstance(p, Polygon):
+        # One pass: element type, then name presence and uniqueness.
+        seen_names = set()
+
+        for i, poly in enumerate(self.polygons):
+            if not isinstance(poly, Polygon):
                 raise TypeError(
                     "All elements of Section.polygons must be Polygon."
                 )
 
-        seen_names = set()
-
-        for i, poly in enumerate(self.polygons):
-            if not poly.name or not poly.name.strip():
+            name = poly.name
+            if not name or not name.strip():
                 raise ValueError(
                     f"VALIDATION ERROR: Polygon at index {i} in section at Z={self.z} "
                     f"has an empty or invalid name. All polygons must have a unique name."
                 )
 
-            if poly.name in seen_names:
+            if name in seen_names:
                 raise ValueError(
-                    f"VALIDATION ERROR: Duplicate polygon name '{poly.name}' detected "
+                    f"VALIDATION ERROR: Duplicate polygon name '{name}' detected "
                     f"in section at Z={self.z}. Each polygon within a section must have a unique name."
                 )
 
-            seen_names.add(poly.name)
+            seen_names.add(name)
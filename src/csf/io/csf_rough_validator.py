@@ -35,6 +35,13 @@ Usage as a library
         for line in report:
             print(line)
 
+Several files can be checked concurrently:
+
+    from csf.io.csf_rough_validator import validate_many
+
+    results = validate_many(["a.yaml", "b.yaml"], workers=4)
+    # {"a.yaml": (True, [...]), "b.yaml": (False, [...])}
+
 Usage as a script
 -----------------
     python -m csf.io.csf_rough_validator my_section.yaml
@@ -45,18 +52,32 @@ Returns 0 (ok), 1 (validation failed), 2 (file not found).
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+import bisect
+import hashlib
 import math
+import os
 import re
 import sys
+import threading
 
 try:
     import yaml  # type: ignore
 except Exception:
     yaml = None
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; the
+# pure-Python SafeLoader is kept for the fallback and for error diagnostics.
+if yaml is not None:
+    try:
+        from yaml import CSafeLoader as _FastSafeLoader  # type: ignore
+    except ImportError:
+        _FastSafeLoader = yaml.SafeLoader
+
 
 # -----------------------------
 # Configuration
@@ -67,12 +88,19 @@ NUM_SNIPPET_AFTER = 2
 
 TOP_KEY = "CSF"
 
+# Max number of distinct (text, source) results kept by validate_text().
+VALIDATION_CACHE_SIZE = 64
+
 
 # -----------------------------
 # Internal types
 # -----------------------------
 
-@dataclass
+# dataclass(slots=True) exists from Python 3.10; older interpreters keep __dict__.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationMessage:
     """
     A single validation message (used by validate_text()).
@@ -89,6 +117,7 @@ class ValidationMessage:
 
 class ValidationError(Exception):
     """Raised internally when the validator wants to stop early with a message."""
+
     def __init__(self, message: str, line: Optional[int] = None, col: Optional[int] = None) -> None:
         super().__init__(message)
         self.message = message
@@ -100,6 +129,8 @@ class ValidationError(Exception):
 # Helpers: numbers and snippets
 # -----------------------------
 
+_isfinite = math.isfinite
+
 def _is_strict_number(v: Any) -> bool:
     """
     "Super safe" numeric check.
@@ -109,26 +140,48 @@ def _is_strict_number(v: Any) -> bool:
     - NOT bool (bool is a subclass of int in Python)
     - finite values only (no NaN/Inf)
     """
-    if type(v) not in (int, float):
-        return False
-    return math.isfinite(float(v))
+    t = type(v)
+    # ints are always finite: only floats need the isfinite test.
+    return t is int or (t is float and _isfinite(v))
+
+
+# Line boundaries exactly as str.splitlines() sees them, so that line numbers
+# computed from raw offsets agree with the ones shown in context snippets.
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 def _make_context_snippet(text: str, line_no: int, col_no: Optional[int] = None) -> str:
     """
     Create a small, human-friendly snippet around a specific line.
+
+    Only the lines shown are sliced out of text; the scan stops after the
+    last one, so large inputs are not split into a full list of lines.
     """
-    lines = text.splitlines()
-    if not lines:
+    if not text:
         return "<empty input>"
 
     lo = max(1, line_no - NUM_SNIPPET_BEFORE)
-    hi = min(len(lines), line_no + NUM_SNIPPET_AFTER)
+    hi = line_no + NUM_SNIPPET_AFTER
+
+    lines: List[str] = []
+    ln = 1
+    start = 0
+    for m in _LINE_BREAK_RE.finditer(text):
+        if ln >= lo:
+            lines.append(text[start:m.start()])
+        start = m.end()
+        ln += 1
+        if ln > hi:
+            break
+    else:
+        # Trailing text without a final line break is a line of its own.
+        if start < len(text) and ln >= lo:
+            lines.append(text[start:])
 
     out: List[str] = []
-    for ln in range(lo, hi + 1):
+    for ln, line in enumerate(lines, start=lo):
         prefix = ">>" if ln == line_no else "  "
-        out.append(f"{prefix} {ln:4d} | {lines[ln - 1]}")
+        out.append(f"{prefix} {ln:4d} | {line}")
         if ln == line_no and col_no is not None and col_no > 0:
             caret_pos = len(f"{prefix} {ln:4d} | ") + (col_no - 1)
             out.append(" " * caret_pos + "^")
@@ -211,6 +264,14 @@ def _find_weight_law_item_lines(text: str) -> List[int]:
 # -----------------------------
 # Phase 1: YAML parsing
 # -----------------------------
+#
+# Design note: the validator intentionally works on the full parsed tree
+# rather than on the YAML event stream. Phase 3 needs random access across
+# the document (weight_laws ids are checked against polygon names collected
+# from every section; messages echo whole items back to the user), and the
+# Phase 2 quoted-number rule is defined on the raw text, including lines that
+# never become scalar events. Tree construction is done by libyaml when
+# available (see _FastSafeLoader), which keeps this phase cheap.
 
 def _safe_yaml_parse(text: str) -> Dict[str, Any]:
     """
@@ -220,7 +281,24 @@ def _safe_yaml_parse(text: str) -> Dict[str, Any]:
         raise ValidationError("PyYAML is not available (cannot parse YAML).")
 
     try:
-        doc = yaml.safe_load(text)
+        doc = yaml.load(text, Loader=_FastSafeLoader)
+    except Exception:
+        doc = _safe_yaml_parse_slow(text)
+
+    if not isinstance(doc, dict):
+        raise ValidationError("YAML root must be a mapping (dictionary).")
+    return doc
+
+
+def _safe_yaml_parse_slow(text: str) -> Any:
+    """
+    Re-parse with the pure-Python SafeLoader.
+
+    Used only after the fast loader has failed: libyaml words its errors
+    differently, and the messages shown to the user are those of SafeLoader.
+    """
+    try:
+        return yaml.safe_load(text)
     except Exception as e:
         # PyYAML usually provides a "problem_mark" with line/column
         mark = getattr(e, "problem_mark", None)
@@ -230,10 +308,6 @@ def _safe_yaml_parse(text: str) -> Dict[str, Any]:
             raise ValidationError(f"YAML syntax error: {getattr(e, 'problem', str(e))}", line=line, col=col)
         raise ValidationError(f"YAML parse error: {e}")
 
-    if not isinstance(doc, dict):
-        raise ValidationError("YAML root must be a mapping (dictionary).")
-    return doc
-
 
 # -----------------------------
 # Phase 2: quoted-number scan (RAW TEXT)
@@ -244,37 +318,46 @@ def _safe_yaml_parse(text: str) -> Dict[str, Any]:
 # - unquoted numbers: 10.0
 # - lists without quotes: [0.15, 0.0]
 # - formulas in strings: "w0 + 0.5*(...)"  (because 0.5 is not quoted inside)
+# The grammar is pure ASCII (re.ASCII: \d is [0-9] only). The padding inside
+# the quotes is blanks/tabs, never a line break, so a match cannot span two
+# lines even when the pattern runs over the whole text.
 _QUOTED_NUMBER_RE = re.compile(
-    r"""(?P<q>["'])\s*(?P<num>[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)\s*(?P=q)"""
+    r"""(?P<q>["'])[ \t]*(?P<num>[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)[ \t]*(?P=q)""",
+    re.ASCII,
 )
 
-def _scan_quoted_numbers_in_text(text: str, excluded_lines: Optional[set] = None) -> List[Tuple[int, int, str]]:
+def _first_quoted_number(
+    text: str,
+    excluded_lines: Optional[Callable[[], Set[int]]] = None,
+) -> Optional[Tuple[int, int, str]]:
     """
-    Scan the raw YAML text for quoted numbers.
+    Scan the raw YAML text for the first quoted number.
 
-    Returns a list of tuples: (line_no, col_no, matched_token)
+    Returns (line_no, col_no, matched_token) for the first hit, or None,
     where matched_token includes the quotes (e.g. '"10.0"').
 
-    Key rule to prevent false positives:
-    - If a line contains no quotes, it cannot be a quoted-number error.
-    - Lines in excluded_lines are skipped (e.g. weight_laws / shear_weight_laws items).
+    The regex runs once over the whole buffer and stops at the first hit;
+    (line, col) are recovered from the match offset only when there is one.
+    excluded_lines is a callable returning the line numbers to skip
+    (e.g. weight_laws / shear_weight_laws items); it is only called once a
+    candidate match exists, so clean files never pay for the line lookup.
     """
-    hits: List[Tuple[int, int, str]] = []
-    lines = text.splitlines()
-
-    for i, raw in enumerate(lines, start=1):
-        if excluded_lines and i in excluded_lines:
-            continue
-        # quick guard: no quotes => cannot be quoted-number
-        if '"' not in raw and "'" not in raw:
+    line_starts: Optional[List[int]] = None
+    excluded: Optional[Set[int]] = None
+
+    for m in _QUOTED_NUMBER_RE.finditer(text):
+        if line_starts is None:
+            line_starts = [0]
+            line_starts.extend(b.end() for b in _LINE_BREAK_RE.finditer(text))
+            excluded = excluded_lines() if excluded_lines is not None else None
+        pos = m.start()
+        i = bisect.bisect_right(line_starts, pos)
+        if excluded and i in excluded:
             continue
+        col = pos - line_starts[i - 1] + 1
+        return i, col, m.group(0)
 
-        for m in _QUOTED_NUMBER_RE.finditer(raw):
-            col = m.start() + 1
-            token = raw[m.start():m.end()]
-            hits.append((i, col, token))
-
-    return hits
+    return None
 
 
 # -----------------------------
@@ -291,32 +374,30 @@ def _require_list(v: Any, what: str) -> List[Any]:
         raise ValidationError(f"{what} must be a YAML list. Found: {type(v).__name__}")
     return v
 
-def _coerce_polygons_container(polys: Any) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+def _coerce_polygons_container(polys: Any) -> Iterator[Tuple[Optional[str], Dict[str, Any]]]:
     """
     Accept polygons as:
       - mapping: {lowerpart: {...}, upperpart: {...}}
       - list:    [{name: lowerpart, ...}, {name: upperpart, ...}]
 
-    Return a uniform list of (name, poly_dict).
+    Yield uniform (name, poly_dict) pairs (no intermediate list).
     For mapping mode: name is the key.
     For list mode: name is poly_dict.get("name") (optional for this validator).
     """
-    out: List[Tuple[Optional[str], Dict[str, Any]]] = []
-
     if isinstance(polys, dict):
         for name, val in polys.items():
             if not isinstance(val, dict):
                 raise ValidationError(f"polygons.{name} must be a mapping. Found: {type(val).__name__}")
-            out.append((str(name), val))
-        return out
+            yield str(name), val
+        return
 
     if isinstance(polys, list):
         for idx, item in enumerate(polys):
             if not isinstance(item, dict):
                 raise ValidationError(f"polygons[{idx}] must be a mapping. Found: {type(item).__name__}")
             nm = item.get("name")
-            out.append((str(nm) if isinstance(nm, str) else None, item))
-        return out
+            yield (str(nm) if isinstance(nm, str) else None), item
+        return
 
     raise ValidationError(f"polygons must be a mapping or list. Found: {type(polys).__name__}")
 
@@ -378,6 +459,14 @@ def _validate_csf_structure(doc: Dict[str, Any], weight_law_item_lines: Optional
         raise ValidationError(f"{TOP_KEY}.sections must be non-empty.")
 
 
+    # Diagnostic paths are only built when an error is raised.
+    def _sec_path(sec_name: Any) -> str:
+        return f"{TOP_KEY}.sections.{sec_name}"
+
+    def _poly_path(sec_name: Any, poly_name: Optional[str]) -> str:
+        sec_path = _sec_path(sec_name)
+        return f"{sec_path}.polygons.{poly_name}" if poly_name else f"{sec_path}.polygons[?]"
+
     # Collect polygon ids while scanning sections.
     # This is used to provide friendlier diagnostics for weight_laws typos (e.g. 'web_star' vs 'web_start').
     poly_ids: set[str] = set()
@@ -386,74 +475,89 @@ def _validate_csf_structure(doc: Dict[str, Any], weight_law_item_lines: Optional
         if not isinstance(sec_name, str) or not sec_name.startswith("S"):
             raise ValidationError(f"{TOP_KEY}.sections keys must start with 'S' (e.g. S0, S1). Found: {sec_name!r}")
 
-        sec_path = f"{TOP_KEY}.sections.{sec_name}"
-        sec_map = _require_mapping(sec_data, sec_path)
+        sec_map = sec_data if isinstance(sec_data, dict) else _require_mapping(sec_data, _sec_path(sec_name))
 
         if "z" not in sec_map:
-            raise ValidationError(f"{sec_path} missing required 'z:' key.")
+            raise ValidationError(f"{_sec_path(sec_name)} missing required 'z:' key.")
         if not _is_strict_number(sec_map["z"]):
             v = sec_map["z"]
             if v is None:
                 raise ValidationError(
-                    f"{sec_path}.z has no value.\n"
+                    f"{_sec_path(sec_name)}.z has no value.\n"
                     "You probably wrote:\n"
                     "  z:\n"
                     "Fix:\n"
                     "  z: 0.0"
                 )
-            raise ValidationError(f"{sec_path}.z must be a finite number (no quotes). Found: {v!r} ({type(v).__name__})")
+            raise ValidationError(f"{_sec_path(sec_name)}.z must be a finite number (no quotes). Found: {v!r} ({type(v).__name__})")
 
         if "polygons" not in sec_map:
-            raise ValidationError(f"{sec_path} missing required 'polygons:' key.")
-
-        poly_items = _coerce_polygons_container(sec_map["polygons"])
-        if not poly_items:
-            raise ValidationError(f"{sec_path}.polygons must be non-empty.")
+            raise ValidationError(f"{_sec_path(sec_name)} missing required 'polygons:' key.")
 
-        for poly_name, poly_map in poly_items:
+        n_polys = 0
+        for poly_name, poly_map in _coerce_polygons_container(sec_map["polygons"]):
+            n_polys += 1
             # If polygons is a list, poly_name may be None. That's ok for this rough validator.
-            poly_path = f"{sec_path}.polygons.{poly_name}" if poly_name else f"{sec_path}.polygons[?]"
-
-
             # Track named polygons for weight_laws validation.
             if isinstance(poly_name, str) and poly_name.strip():
                 poly_ids.add(poly_name.strip())
 
             if "weight" not in poly_map:
-                raise ValidationError(f"{poly_path} missing required 'weight:' key.")
+                raise ValidationError(f"{_poly_path(sec_name, poly_name)} missing required 'weight:' key.")
             if not _is_strict_number(poly_map["weight"]):
                 v = poly_map["weight"]
                 if v is None:
                     raise ValidationError(
-                        f"{poly_path}.weight has no value.\n"
+                        f"{_poly_path(sec_name, poly_name)}.weight has no value.\n"
                         "You probably wrote:\n"
                         "  weight:\n"
                         "Fix:\n"
                         "  weight: 1.0"
                     )
-                raise ValidationError(f"{poly_path}.weight must be a finite number (no quotes). Found: {v!r} ({type(v).__name__})")
+                raise ValidationError(f"{_poly_path(sec_name, poly_name)}.weight must be a finite number (no quotes). Found: {v!r} ({type(v).__name__})")
 
             if "vertices" not in poly_map:
-                raise ValidationError(f"{poly_path} missing required 'vertices:' key.")
+                raise ValidationError(f"{_poly_path(sec_name, poly_name)} missing required 'vertices:' key.")
 
-            verts = _require_list(poly_map["vertices"], f"{poly_path}.vertices")
+            verts = poly_map["vertices"]
+            if not isinstance(verts, list):
+                _require_list(verts, f"{_poly_path(sec_name, poly_name)}.vertices")
             if len(verts) < 3:
-                raise ValidationError(f"{poly_path}.vertices must have at least 3 vertices.")
-
+                raise ValidationError(f"{_poly_path(sec_name, poly_name)}.vertices must have at least 3 vertices.")
+
+            # The vertex check stays a scalar loop on purpose: vertices arrive as
+            # Python lists from YAML, and converting them to a NumPy array
+            # (np.array / np.fromiter) costs more than this loop even for
+            # polygons with thousands of vertices. NumPy would also coerce
+            # "1.5" and True to float, which this validator must reject.
+            # A JIT kernel (e.g. Numba) would need that same array and is not
+            # used for the same reason.
             for j, v in enumerate(verts):
+                # Fast path (inlined _is_strict_number): a well-formed [x, y]
+                # pair of finite int/float values costs no function calls.
+                if type(v) is list and len(v) == 2:
+                    x, y = v
+                    tx = type(x)
+                    ty = type(y)
+                    if (tx is int or (tx is float and _isfinite(x))) and (ty is int or (ty is float and _isfinite(y))):
+                        continue
+
                 if not isinstance(v, list) or len(v) != 2:
-                    raise ValidationError(f"{poly_path}.vertices[{j}] must be [x, y]. Found: {v!r}")
+                    raise ValidationError(f"{_poly_path(sec_name, poly_name)}.vertices[{j}] must be [x, y]. Found: {v!r}")
                 x, y = v[0], v[1]
                 if not _is_strict_number(x) or not _is_strict_number(y):
                     if x is None or y is None:
                         raise ValidationError(
-                            f"{poly_path}.vertices[{j}] has a missing coordinate.\n"
+                            f"{_poly_path(sec_name, poly_name)}.vertices[{j}] has a missing coordinate.\n"
                             "You probably wrote:\n"
                             "  - [0.0, ]\n"
                             "Fix:\n"
                             "  - [0.0, 0.0]"
                         )
-                    raise ValidationError(f"{poly_path}.vertices[{j}] coordinates must be numbers (no quotes). Found: {v!r}")
+                    raise ValidationError(f"{_poly_path(sec_name, poly_name)}.vertices[{j}] coordinates must be numbers (no quotes). Found: {v!r}")
+
+        if not n_polys:
+            raise ValidationError(f"{_sec_path(sec_name)}.polygons must be non-empty.")
 
     # weight_laws optional, if present must be list of strings containing ":"
     if "weight_laws" in csf:
@@ -718,15 +822,95 @@ def _validate_csf_structure(doc: Dict[str, Any], weight_law_item_lines: Optional
 # Public API
 # -----------------------------
 
-def validate_text(text: str, source: str = "<memory>") -> Tuple[bool, List[str]]:
+# validate_text() memo: (blake2b digest of text, source) -> (ok, report lines).
+_VALIDATION_CACHE: "OrderedDict[Tuple[bytes, str], Tuple[bool, Tuple[str, ...]]]" = OrderedDict()
+# Guards the memo when validate_text() runs from several threads (validate_many).
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+def validate_text(
+    text: str,
+    source: str = "<memory>",
+    sink: Optional[Callable[[str], None]] = None,
+) -> Tuple[bool, Sequence[str]]:
     """
     Library entry point: validate YAML text and return (ok, report_lines).
 
     - ok == True  → safe to proceed to the next phase (formal CSFReader parsing)
     - ok == False → report_lines contains human-friendly messages
+
+    If sink is given (e.g. print), each report line is passed to it instead
+    and the returned report is an empty tuple.
+
+    Results are memoized by (content digest, source): validating the same text
+    again (e.g. several plans referencing one CSF file) does not re-parse it.
+    Use validate_text.cache_clear() to drop the cache.
+    """
+    key = (hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest(), source)
+    with _VALIDATION_CACHE_LOCK:
+        cached = _VALIDATION_CACHE.get(key)
+        if cached is not None:
+            _VALIDATION_CACHE.move_to_end(key)
+    if cached is not None:
+        if sink is not None:
+            for line in cached[1]:
+                sink(line)
+            return cached[0], ()
+        return cached[0], list(cached[1])
+
+    ok, report = _validate_text_uncached(text, source)
+
+    with _VALIDATION_CACHE_LOCK:
+        _VALIDATION_CACHE[key] = (ok, tuple(report))
+        while len(_VALIDATION_CACHE) > VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+    if sink is not None:
+        for line in report:
+            sink(line)
+        return ok, ()
+    return ok, report
+
+
+def _validation_cache_clear() -> None:
+    """Drop all memoized validate_text results (under the cache lock)."""
+    with _VALIDATION_CACHE_LOCK:
+        _VALIDATION_CACHE.clear()
+
+
+validate_text.cache_clear = _validation_cache_clear  # type: ignore[attr-defined]
+
+
+def _missing_root_key_report(text: str) -> List[str]:
+    """
+    Report lines for a document without the root key.
+
+    The first top-level key is located directly in raw text so that a missing
+    "CSF:" root can be reported with a clearer and more localized diagnostic.
     """
+    report = [f"[ERROR] Missing required root key '{TOP_KEY}:'."]
+
+    first_root_key, first_root_line = _find_first_root_key_in_text(text)
+    if first_root_key is not None and first_root_line is not None:
+        report.append(
+            f"First top-level key found at line {first_root_line}: '{first_root_key}:'"
+        )
+        report.append(_make_context_snippet(text, first_root_line, 1))
+        report.append(f"Hint: wrap the whole file under '{TOP_KEY}:'.")
+    else:
+        report.append("No top-level YAML key was found.")
+        report.append(f"Hint: the file must start with '{TOP_KEY}:'.")
+
+    return report
+
+
+def _validate_text_uncached(text: str, source: str) -> Tuple[bool, List[str]]:
+    """Run the validation phases on text (no memoization)."""
     report: List[str] = []
 
+    # 0) Fail fast on input that cannot contain the root key at all
+    # (e.g. an unrelated YAML file): no need to pay for the YAML parse.
+    if TOP_KEY not in text:
+        return False, _missing_root_key_report(text)
+
     # 1) YAML parse
     try:
         doc = _safe_yaml_parse(text)
@@ -736,37 +920,25 @@ def validate_text(text: str, source: str = "<memory>") -> Tuple[bool, List[str]]
             report.append(_make_context_snippet(text, e.line, e.col))
         return False, report
 
-    # Check the first top-level key directly in raw text so that a missing
-    # "CSF:" root can be reported with a clearer and more localized diagnostic.
-    first_root_key, first_root_line = _find_first_root_key_in_text(text)
     if TOP_KEY not in doc:
-        report.append(f"[ERROR] Missing required root key '{TOP_KEY}:'.")
-
-        if first_root_key is not None and first_root_line is not None:
-            report.append(
-                f"First top-level key found at line {first_root_line}: '{first_root_key}:'"
-            )
-            report.append(_make_context_snippet(text, first_root_line, 1))
-            report.append(f"Hint: wrap the whole file under '{TOP_KEY}:'.")
-        else:
-            report.append("No top-level YAML key was found.")
-            report.append(f"Hint: the file must start with '{TOP_KEY}:'.")
-
-        return False, report
+        return False, _missing_root_key_report(text)
 
     # 2) quoted-number scan (raw text)
-    _excluded_law_lines = (
-        set(_find_law_item_lines(text, "weight_laws"))
-        | set(_find_law_item_lines(text, "shear_weight_laws"))
-    )
-    qhits = _scan_quoted_numbers_in_text(text, excluded_lines=_excluded_law_lines)
-    if qhits:
-        ln, col, token = qhits[0]
+    # Quick reject: without any quote character there is nothing to scan,
+    # and the law-item line lookup can be skipped as well.
+    qhit = None
+    if '"' in text or "'" in text:
+        def _excluded_law_lines() -> Set[int]:
+            return (
+                set(_find_law_item_lines(text, "weight_laws"))
+                | set(_find_law_item_lines(text, "shear_weight_laws"))
+            )
+        qhit = _first_quoted_number(text, excluded_lines=_excluded_law_lines)
+    if qhit is not None:
+        ln, col, token = qhit
         report.append("[ERROR] Quoted numbers detected. All numeric values must be raw (no quotes).")
         report.append(f"First occurrence at line {ln}, column {col}: {token}")
         report.append(_make_context_snippet(text, ln, col))
-        if len(qhits) > 1:
-            report.append(f"Additional quoted numbers found: {len(qhits) - 1}")
         report.append('Hint: replace "10.0" with 10.0 (remove quotes).')
         return False, report
 
@@ -783,6 +955,68 @@ def validate_text(text: str, source: str = "<memory>") -> Tuple[bool, List[str]]
     return True, ["[OK] Rough CSF validation passed."]
 
 
+def _read_text_utf8(p: Path) -> str:
+    """
+    Read a whole UTF-8 file with raw os.read calls and a single decode.
+
+    Newlines are translated like Path.read_text() does ('\r\n' and '\r' -> '\n'),
+    so the validated text is the same as before.
+    """
+    fd = os.open(str(p), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks: List[bytes] = []
+        while True:
+            # st_size is a hint: keep reading until EOF (short reads, growing files).
+            chunk = os.read(fd, max(size, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _validate_path(filepath: str) -> Tuple[bool, List[str]]:
+    """Read and validate one file; missing/unreadable files become a failed report."""
+    p = Path(filepath)
+    if not p.exists():
+        return False, [f"ERROR: file not found: {filepath}"]
+    try:
+        text = _read_text_utf8(p)
+    except Exception as e:
+        return False, [f"ERROR: cannot read file: {filepath}: {e}"]
+    ok, report = validate_text(text, source=str(p))
+    return ok, list(report)
+
+
+def validate_many(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+) -> Dict[str, Tuple[bool, List[str]]]:
+    """
+    Validate several CSF files with a thread pool.
+
+    Returns {path: (ok, report_lines)} in input order. Missing or unreadable
+    files are reported as failures instead of raising.
+
+    workers defaults to os.cpu_count(). File reads overlap across threads;
+    YAML parsing itself holds the GIL, so CPU-bound batches gain less.
+    """
+    keys = [str(p) for p in paths]
+    if not keys:
+        return {}
+    max_workers = min(workers or os.cpu_count() or 1, len(keys))
+    if max_workers <= 1:
+        return {k: _validate_path(k) for k in keys}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(keys, pool.map(_validate_path, keys)))
+
+
 def csf_rough_validator(filepath: str) -> int:
     """
     Script-friendly entry point.
@@ -798,13 +1032,10 @@ def csf_rough_validator(filepath: str) -> int:
         return 2
 
     try:
-        text = p.read_text(encoding="utf-8")
+        text = _read_text_utf8(p)
     except Exception as e:
         print(f"ERROR: cannot read file: {filepath}: {e}", file=sys.stderr)
         return 2
 
-    ok, report = validate_text(text, source=str(p))
-    for line in report:
-        print(line)
-
+    ok, _ = validate_text(text, source=str(p), sink=print)
     return 0 if ok else 1
@@ -630,11 +630,7 @@ def mesh_diagnostics(mesh_payload: MeshPayload) -> Dict[str, Any]:
     else:
         xmin = ymin = xmax = ymax = float("nan")
 
-    elem_areas: List[float] = []
-    for tri in triangles:
-        A, _b, _c, _centroid = _triangle_geometry(points, tri)
-        elem_areas.append(float(A))
-    area_arr = np.asarray(elem_areas, dtype=float)
+    area_arr, _b, _c, _centroids = _triangle_geometry(points, triangles)
 
     unique_regions = sorted(set(int(r) for r in mesh_payload.element_region.tolist()))
     region_counts = {
@@ -752,28 +748,25 @@ def solve_torsion(
 # -----------------------------------------------------------------------------
 
 
-def _triangle_geometry(points: np.ndarray, tri: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray, Tuple[float, float]]:
-    """Return area, shape-function gradients, centroid and centroid tuple."""
-    xy = points[tri]
-    x1, y1 = xy[0]
-    x2, y2 = xy[1]
-    x3, y3 = xy[2]
+def _triangle_geometry(points: np.ndarray, triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return areas, shape-function gradients and centroids of all elements.
+
+    Evaluated for the whole connectivity at once: areas has shape (nelems,),
+    b and c have shape (nelems, 3), centroids has shape (nelems, 2).
+    """
+    xy = points[triangles]
+    x1, x2, x3 = xy[:, 0, 0], xy[:, 1, 0], xy[:, 2, 0]
+    y1, y2, y3 = xy[:, 0, 1], xy[:, 1, 1], xy[:, 2, 1]
     det = (x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)
-    area = 0.5 * det
-    if area <= 0.0:
-        # Triangle may be clockwise depending on the mesher. Use positive area
-        # and gradients consistent with the signed determinant.
-        pass
-    A = abs(area)
-    if A <= 0.0:
+    # Triangles may be clockwise depending on the mesher. Use positive areas
+    # and gradients consistent with the signed determinant.
+    areas = np.abs(0.5 * det)
+    if np.any(areas <= 0.0):
         raise ValueError("Degenerate triangle with zero area.")
-    denom = det
-    if denom == 0.0:
-        raise ValueError("Degenerate triangle with zero determinant.")
-    b = np.array([y2 - y3, y3 - y1, y1 - y2], dtype=float) / denom
-    c = np.array([x3 - x2, x1 - x3, x2 - x1], dtype=float) / denom
-    centroid = np.mean(xy, axis=0)
-    return A, b, c, (float(centroid[0]), float(centroid[1]))
+    b = np.stack((y2 - y3, y3 - y1, y1 - y2), axis=1) / det[:, None]
+    c = np.stack((x3 - x2, x1 - x3, x2 - x1), axis=1) / det[:, None]
+    centroids = np.mean(xy, axis=1)
+    return areas, b, c, centroids
 
 
 def _boundary_nodes_from_triangles(triangles: np.ndarray) -> np.ndarray:
@@ -837,26 +830,26 @@ def solve_prandtl_dirichlet(mesh_payload: MeshPayload, pin_node: int = 0) -> Sol
     G_elems = mesh_payload.element_G
     n = points.shape[0]
 
-    rows: List[int] = []
-    cols: List[int] = []
-    data: List[float] = []
-    rhs = np.zeros(n, dtype=float)
+    non_positive = np.flatnonzero(G_elems <= 0.0)
+    if non_positive.size:
+        e = int(non_positive[0])
+        raise SystemExit(f"Element {e} has non-positive G={float(G_elems[e])}.")
 
-    for e, tri in enumerate(triangles):
-        G = float(G_elems[e])
-        if G <= 0.0:
-            raise SystemExit(f"Element {e} has non-positive G={G}.")
-        A, b, c, _centroid = _triangle_geometry(points, tri)
-        ke = (A / G) * (np.outer(b, b) + np.outer(c, c))
-        fe = np.full(3, 2.0 * A / 3.0, dtype=float)
-        for i_local, i_global in enumerate(tri):
-            rhs[int(i_global)] += float(fe[i_local])
-            for j_local, j_global in enumerate(tri):
-                rows.append(int(i_global))
-                cols.append(int(j_global))
-                data.append(float(ke[i_local, j_local]))
-
-    K = coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+    areas, grad_b, grad_c, centroids = _triangle_geometry(points, triangles)
+
+    # Element matrices ke = (A / G) (b b^T + c c^T) for all elements at once,
+    # shape (nelems, 3, 3). The COO triplets are laid out element by element,
+    # row-major within each element, i.e. in the order of a per-element loop.
+    ke = (areas / G_elems)[:, None, None] * (
+        grad_b[:, :, None] * grad_b[:, None, :] + grad_c[:, :, None] * grad_c[:, None, :]
+    )
+    rows = np.repeat(triangles, 3, axis=1).ravel()
+    cols = np.tile(triangles, (1, 3)).ravel()
+    K = coo_matrix((ke.ravel(), (rows, cols)), shape=(n, n)).tocsr()
+
+    # Consistent load 2A/3 per element node; add.at accumulates shared nodes.
+    rhs = np.zeros(n, dtype=float)
+    np.add.at(rhs, triangles.ravel(), np.repeat(2.0 * areas / 3.0, 3))
 
     boundary = _boundary_nodes_from_triangles(triangles)
     is_free = np.ones(n, dtype=bool)
@@ -872,16 +865,12 @@ def solve_prandtl_dirichlet(mesh_payload: MeshPayload, pin_node: int = 0) -> Sol
     rhsf = rhs[is_free]
     phi[is_free] = spsolve(Kff, rhsf)
 
-    gj = 0.0
-    polar_upper = 0.0
-    area_total = 0.0
-    for e, tri in enumerate(triangles):
-        G = float(G_elems[e])
-        A, _b, _c, (xc, yc) = _triangle_geometry(points, tri)
-        phi_mean = float(np.mean(phi[tri]))
-        gj += 2.0 * A * phi_mean
-        polar_upper += G * A * (xc**2 + yc**2)
-        area_total += A
+    xc = centroids[:, 0]
+    yc = centroids[:, 1]
+    phi_mean = np.mean(phi[triangles], axis=1)
+    gj = float(np.sum(2.0 * areas * phi_mean))
+    polar_upper = float(np.sum(G_elems * areas * (xc**2 + yc**2)))
+    area_total = float(np.sum(areas))
 
     return SolverOutput(
         gj=float(gj),
@@ -130,21 +130,19 @@ class Visualizer:
         num_polys = len(self.field.s0.polygons)
         poly_w_series = {i: [] for i in range(num_polys)}
         
+        # Polygon pairs and their laws do not depend on z: look them up once
+        pairs = list(zip(self.field.s0.polygons, self.field.s1.polygons))
+        weight_laws = self.field.weight_laws or {}
+        laws = [weight_laws.get(i + 1) for i in range(num_polys)] # 1 based i'm sorry
+
         # Evaluate weights for every polygon index at every sampled z
         for z in z_values:
+            zlocal= z - self.field.s0.z
             for i in range(num_polys):
-                p0 = self.field.s0.polygons[i]
-                p1 = self.field.s1.polygons[i]
-
-                if self.field.weight_laws is not None and (i + 1) in self.field.weight_laws: # 1 based i'm sorry
-                    current_law = self.field.weight_laws[i + 1]
-                else:
-                    current_law = None
-                
-                zlocal= z - self.field.s0.z
+                p0, p1 = pairs[i]
 
                 w_val = self.field._interpolate_weight(
-                    p0.weight, p1.weight, zlocal, p0, p1, current_law
+                    p0.weight, p1.weight, zlocal, p0, p1, laws[i]
                 )
                 
                 poly_w_series[i].append(float(w_val))
@@ -311,35 +309,25 @@ class Visualizer:
         num_polys = len(self.field.s0.polygons)
         poly_w_series = {i: [] for i in range(num_polys)}
         
+        # Polygon pairs and their laws do not depend on z: look them up once
+        pairs = list(zip(self.field.s0.polygons, self.field.s1.polygons))
+        shear_weight_laws = self.field.shear_weight_laws or {}
+        weight_laws = self.field.weight_laws or {}
+        shear_laws = [shear_weight_laws.get(i) for i in range(num_polys)]
+        laws = [weight_laws.get(i + 1) for i in range(num_polys)] # 1 based i'm sorry
+
         # Evaluate weights for every polygon index at every sampled z
         for z in z_values:
+            zlocal= z - self.field.s0.z
             for i in range(num_polys):
-                p0 = self.field.s0.polygons[i]
-                p1 = self.field.s1.polygons[i]
-
-                if self.field.shear_weight_laws is not None and (i) in self.field.shear_weight_laws:
-                    current_shear_law = self.field.shear_weight_laws[i]
-                else:
-                    current_shear_law = None
-                
-                if self.field.weight_laws is not None and (i + 1) in self.field.weight_laws: # 1 based i'm sorry
-                    current_law = self.field.weight_laws[i + 1]
-                else:
-                    current_law = None
-                
-
-
-                zlocal= z - self.field.s0.z
-                
-
+                p0, p1 = pairs[i]
 
                 w_val = self.field._interpolate_weight(
-                    p0.weight, p1.weight, zlocal, p0, p1, current_law
+                    p0.weight, p1.weight, zlocal, p0, p1, laws[i]
                 )
-                
 
                 shear_w_val = self.field._interpolate_shear_weight(w_val,
-                    p0.weight, p1.weight, zlocal, p0, p1, current_shear_law
+                    p0.weight, p1.weight, zlocal, p0, p1, shear_laws[i]
                 )
                 
                 poly_w_series[i].append(float(shear_w_val))
@@ -541,9 +529,9 @@ class Visualizer:
         )        
 
 
-        for z in z_values:
-            # Build section at current z
-            current_section = self.field.section(z)
+        # Build all sections in one batched vertex interpolation
+        # (same vertices as calling self.field.section(z) at each z)
+        for current_section in self.field.sections(z_values):
 
             # Compute all properties for current section
 
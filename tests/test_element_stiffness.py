@@ -0,0 +1,86 @@
+"""
+assemble_element_stiffness_matrix on a tapered rectangle, against closed forms.
+
+The width tapers linearly b(z) = b0 + (b1 - b0) z / L at constant height h,
+so EA and EIx are linear in z and EIy is cubic: Gauss-Legendre with two or
+more points averages all of them exactly.
+"""
+
+import numpy as np
+import pytest
+
+from csf import ContinuousSectionField, Polygon, Pt, Section
+from csf.section_field import assemble_element_stiffness_matrix
+
+E_REF = 2.0
+L = 10.0
+B0, B1, H = 0.4, 0.2, 0.6
+
+
+def _rect(b, h):
+    return Polygon(
+        vertices=(Pt(-b / 2, -h / 2), Pt(b / 2, -h / 2), Pt(b / 2, h / 2), Pt(-b / 2, h / 2)),
+        weight=1.0,
+        name="web",
+    )
+
+
+def _tapered_field():
+    return ContinuousSectionField(
+        Section(polygons=(_rect(B0, H),), z=0.0),
+        Section(polygons=(_rect(B1, H),), z=L),
+    )
+
+
+def _mean_power(p):
+    """Length average of b(z)**p for the linear taper."""
+    return (B1 ** (p + 1) - B0 ** (p + 1)) / ((p + 1) * (B1 - B0))
+
+
+@pytest.mark.parametrize("n_gauss", [2, 3, 5])
+def test_tapered_element_stiffness(n_gauss):
+    K = assemble_element_stiffness_matrix(_tapered_field(), E_ref=E_REF, n_gauss=n_gauss)
+
+    assert K.shape == (12, 12)
+    np.testing.assert_allclose(K, K.T, rtol=0.0, atol=0.0)
+
+    # The element takes its [uy, thz] bending stiffness from
+    # section_stiffness_matrix()[1, 1] = E*Iy and its [uz, thy] one from
+    # [2, 2] = E*Ix (Ix = integral of y^2, Iy = integral of x^2).
+    EA = E_REF * H * _mean_power(1)              # mean of E b h
+    EIx = E_REF * H / 12.0 * _mean_power(3)       # mean of E h b^3 / 12 (E*Iy)
+    EIy = E_REF * H ** 3 / 12.0 * _mean_power(1)  # mean of E b h^3 / 12 (E*Ix)
+
+    # Axial: EA/L
+    np.testing.assert_allclose(K[0, 0], EA / L, rtol=1e-12)
+    np.testing.assert_allclose(K[6, 6], EA / L, rtol=1e-12)
+    np.testing.assert_allclose(K[0, 6], -EA / L, rtol=1e-12)
+
+    # Flexure about X [uy1, thz1, uy2, thz2] and about Y [uz1, thy1, uz2, thy2]
+    np.testing.assert_allclose(K[1, 1], 12.0 * EIx / L ** 3, rtol=1e-12)
+    np.testing.assert_allclose(K[5, 5], 4.0 * EIx / L, rtol=1e-12)
+    np.testing.assert_allclose(K[5, 11], 2.0 * EIx / L, rtol=1e-12)
+    np.testing.assert_allclose(K[2, 2], 12.0 * EIy / L ** 3, rtol=1e-12)
+    np.testing.assert_allclose(K[4, 4], 4.0 * EIy / L, rtol=1e-12)
+    np.testing.assert_allclose(K[4, 10], 2.0 * EIy / L, rtol=1e-12)
+
+    # Off-diagonal Hermite terms are full, not halved by the symmetrization
+    np.testing.assert_allclose(K[1, 5], 6.0 * EIx / L ** 2, rtol=1e-12)
+    np.testing.assert_allclose(K[1, 7], -12.0 * EIx / L ** 3, rtol=1e-12)
+    np.testing.assert_allclose(K[2, 4], -6.0 * EIy / L ** 2, rtol=1e-12)
+
+    # Rigid-body translations produce no forces
+    for dof in (0, 1, 2):
+        u = np.zeros(12)
+        u[dof] = u[dof + 6] = 1.0
+        np.testing.assert_allclose(K @ u, 0.0, atol=1e-12 * np.abs(K).max())
+
+    # Rigid-body rotations: thz with uy2 = L, thy with uz2 = -L
+    for rot, disp, sign in ((5, 7, 1.0), (4, 8, -1.0)):
+        u = np.zeros(12)
+        u[rot] = u[rot + 6] = 1.0
+        u[disp] = sign * L
+        np.testing.assert_allclose(K @ u, 0.0, atol=1e-12 * np.abs(K).max())
+
+    # Doubly symmetric section: no EIxy coupling
+    np.testing.assert_allclose(K[1, 2], 0.0, atol=1e-12 * K[1, 1])
@@ -0,0 +1,103 @@
+"""
+validate_text() memoization and the validate_many() batch entry point.
+
+validate_many() must report exactly what validate_text() reports for each
+file, in input order, whether the result comes from the memo or not.
+"""
+
+import csf.io.csf_rough_validator as rv
+from csf.io.csf_rough_validator import validate_many, validate_text
+
+
+VALID = """\
+CSF:
+  sections:
+    S0:
+      z: 0.0
+      polygons:
+        rect:
+          weight: 1.0
+          vertices:
+            - [-0.5, 0.0]
+            - [ 0.5, 0.0]
+            - [ 0.5, 1.0]
+            - [-0.5, 1.0]
+    S1:
+      z: 5.0
+      polygons:
+        rect:
+          weight: 1.0
+          vertices:
+            - [-0.5, 0.0]
+            - [ 0.5, 0.0]
+            - [ 0.5, 2.0]
+            - [-0.5, 2.0]
+"""
+
+NO_ROOT = "foo: 1\n"
+BAD_YAML = "CSF:\n  sections: [\n"
+
+
+def _write(tmp_path, name, text):
+    p = tmp_path / name
+    p.write_text(text, encoding="utf-8")
+    return p
+
+
+def test_validate_many_matches_validate_text_in_order(tmp_path):
+    """Mixed valid, invalid, missing and duplicate inputs keep order and reports."""
+    paths = [
+        _write(tmp_path, "b_valid.yaml", VALID),
+        _write(tmp_path, "a_no_root.yaml", NO_ROOT),
+        _write(tmp_path, "c_bad_yaml.yaml", BAD_YAML),
+        _write(tmp_path, "d_valid_copy.yaml", VALID),
+        tmp_path / "missing.yaml",
+    ]
+    paths.append(paths[1])  # same file listed twice
+
+    validate_text.cache_clear()
+    expected = {}
+    for p in paths:
+        if p.exists():
+            ok, report = validate_text(p.read_text(encoding="utf-8"), source=str(p))
+            expected[str(p)] = (ok, list(report))
+        else:
+            expected[str(p)] = (False, [f"ERROR: file not found: {p}"])
+
+    for workers in (1, 4):
+        validate_text.cache_clear()
+        result = validate_many(paths, workers=workers)
+        assert list(result) == list(dict.fromkeys(str(p) for p in paths))
+        assert result == expected
+
+    assert [ok for ok, _ in result.values()] == [True, False, False, True, False]
+
+
+def test_repeated_input_hits_the_memo(monkeypatch):
+    """The second call with the same text and source is served from the memo."""
+    validate_text.cache_clear()
+    calls = []
+    uncached = rv._validate_text_uncached
+
+    def counting(text, source):
+        calls.append(source)
+        return uncached(text, source)
+
+    monkeypatch.setattr(rv, "_validate_text_uncached", counting)
+
+    first = validate_text(BAD_YAML, source="plan.yaml")
+    second = validate_text(BAD_YAML, source="plan.yaml")
+
+    assert calls == ["plan.yaml"]
+    assert second == first
+    assert second[0] is False
+
+
+def test_cache_clear_empties_the_memo():
+    validate_text(VALID, source="a.yaml")
+    validate_text(NO_ROOT, source="b.yaml")
+    assert len(rv._VALIDATION_CACHE) >= 2
+
+    validate_text.cache_clear()
+
+    assert len(rv._VALIDATION_CACHE) == 0
@@ -0,0 +1,120 @@
+"""
+Memoized section results must follow the _tol tolerances.
+
+ContinuousSectionField rescales the module-level tolerances in csf._tol for
+every field, so the same section analysed under two fields of different
+scale has to be computed once per tolerance set, never served across them.
+"""
+
+import csf.section_field as sf
+from csf import (
+    ContinuousSectionField,
+    Polygon,
+    Pt,
+    Section,
+    clear_section_cache,
+    section_full_analysis,
+)
+from csf import _tol
+
+
+def _rect(b, h, name="rect", weight=1.0):
+    return Polygon(
+        vertices=(Pt(-b / 2, -h / 2), Pt(b / 2, -h / 2), Pt(b / 2, h / 2), Pt(-b / 2, h / 2)),
+        weight=weight,
+        name=name,
+    )
+
+
+def test_full_analysis_cache_follows_field_tolerances(monkeypatch):
+    """Two fields at different scales: each gets a result under its own tolerances."""
+    clear_section_cache()
+
+    computed_under = []
+    uncached = sf._section_full_analysis_uncached
+
+    def spy(section, compute_vroark=True):
+        computed_under.append(_tol.EPS_L)
+        return uncached(section, compute_vroark)
+
+    monkeypatch.setattr(sf, "_section_full_analysis_uncached", spy)
+
+    poly = _rect(0.3, 0.6)
+    sec = Section(polygons=(poly,), z=0.0)
+
+    # Short field: scale 5 -> EPS_L = 5e-12
+    ContinuousSectionField(sec, Section(polygons=(poly,), z=5.0))
+    eps_short = _tol.EPS_L
+    first = section_full_analysis(sec, compute_vroark=False)
+    again = section_full_analysis(sec, compute_vroark=False)
+    assert computed_under == [eps_short]
+    assert again == first
+
+    # Long field: scale 5000 -> tolerances rescaled, cached entry must not be reused
+    ContinuousSectionField(sec, Section(polygons=(poly,), z=5000.0))
+    eps_long = _tol.EPS_L
+    assert eps_long != eps_short
+    second = section_full_analysis(sec, compute_vroark=False)
+    assert computed_under == [eps_short, eps_long]
+    assert second == {**uncached(sec, compute_vroark=False), "z": sec.z}
+
+    # clear_section_cache forces a recomputation under the same tolerances
+    clear_section_cache()
+    section_full_analysis(sec, compute_vroark=False)
+    assert computed_under == [eps_short, eps_long, eps_long]
+
+
+def test_section_properties_cache_follows_field_tolerances(monkeypatch):
+    """section_properties shares the tolerance-keyed memo of section_full_analysis."""
+    clear_section_cache()
+
+    computed_under = []
+    uncached = sf._section_properties_uncached
+
+    def spy(section):
+        computed_under.append(_tol.EPS_A)
+        return uncached(section)
+
+    monkeypatch.setattr(sf, "_section_properties_uncached", spy)
+
+    poly = _rect(0.3, 0.6)
+    sec = Section(polygons=(poly,), z=0.0)
+
+    ContinuousSectionField(sec, Section(polygons=(poly,), z=5.0))
+    eps_short = _tol.EPS_A
+    first = sf.section_properties(sec)
+    assert sf.section_properties(sec) == first
+    assert computed_under == [eps_short]
+
+    # At scale 5000 EPS_K (~6e2) exceeds the inertias of this small section,
+    # so the result really differs: the old entry must not be served.
+    ContinuousSectionField(sec, Section(polygons=(poly,), z=5000.0))
+    eps_long = _tol.EPS_A
+    second = sf.section_properties(sec)
+    assert computed_under == [eps_short, eps_long]
+    assert second == {**uncached(sec), "z": sec.z}
+    assert second != first
+
+
+def test_direct_children_map_has_no_tolerance_side_effects():
+    """The cached containment map neither rescales _tol nor hands out a mutable dict."""
+    outer = _rect(4.0, 6.0, name="outer")
+    inner = _rect(2.0, 3.0, name="inner", weight=0.0)
+    field = ContinuousSectionField(
+        Section(polygons=(outer, inner), z=0.0),
+        Section(polygons=(outer, inner), z=40.0),
+    )
+    tol_before = sf._tol_key()
+
+    sf._direct_children_map.cache_clear()
+    for _ in range(2):  # cache miss, then hit
+        children = sf._direct_children_map(field.s0.polygons)
+        assert sf._tol_key() == tol_before
+
+    assert dict(children) == {0: (1,)}
+    try:
+        children[0] = (0,)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("_direct_children_map returned a mutable mapping")